@@ -6,8 +6,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -15,10 +14,28 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN
 from .coordinator import BreezartDataCoordinator
 
+# (unique_suffix, name, key, device_class, entity_category)
+_BINARY_SENSORS: tuple[
+    tuple[str, str, str, BinarySensorDeviceClass | None, EntityCategory | None], ...
+] = (
+    ("is_warn_err", "Предупреждение", "is_warn_err",
+     BinarySensorDeviceClass.PROBLEM, EntityCategory.DIAGNOSTIC),
+    ("is_fatal_err", "Критическая ошибка", "is_fatal_err",
+     BinarySensorDeviceClass.PROBLEM, EntityCategory.DIAGNOSTIC),
+    ("danger_overheat", "Угроза перегрева", "danger_overheat",
+     BinarySensorDeviceClass.HEAT, EntityCategory.DIAGNOSTIC),
+    ("change_filter", "Требуется замена фильтра", "change_filter",
+     BinarySensorDeviceClass.PROBLEM, EntityCategory.DIAGNOSTIC),
+    ("power", "Установка включена", "power",
+     BinarySensorDeviceClass.RUNNING, None),
+)
+
 
 class BreezartBinarySensor(CoordinatorEntity[BreezartDataCoordinator], BinarySensorEntity):
     """Base binary sensor for Breezart."""
 
+    __slots__ = ("_key",)
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -32,28 +49,27 @@ class BreezartBinarySensor(CoordinatorEntity[BreezartDataCoordinator], BinarySen
     ) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"breezart_{coordinator.client.host}_{unique_suffix}"
+        self._attr_unique_id = f"{coordinator.client.unique_id_prefix}{unique_suffix}"
         self._attr_name = name
         self._attr_device_class = device_class
         self._attr_entity_category = entity_category
         self._key = key
+        self._attr_device_info = coordinator.client.device_info
+        self._update_is_on()
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if the binary sensor is on."""
-        if not self.coordinator.data:
-            return None
-        return bool(self.coordinator.data.get(self._key, False))
+    def _update_is_on(self) -> None:
+        """Latch is_on from the latest coordinator data."""
+        data = self.coordinator.data
+        self._attr_is_on = bool(data.get(self._key, False)) if data else None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.client.host)},
-            name="Breezart",
-            manufacturer="Breezart",
-            model="550 Aqua",
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update is_on once per coordinator refresh, if it changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and self._key not in changed:
+            return
+        self._update_is_on()
+        super()._handle_coordinator_update()
 
 
 async def async_setup_entry(
@@ -64,34 +80,6 @@ async def async_setup_entry(
     """Set up Breezart binary sensor entities."""
     coordinator: BreezartDataCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    async_add_entities([
-        BreezartBinarySensor(
-            coordinator, "is_warn_err", "Предупреждение",
-            "is_warn_err",
-            BinarySensorDeviceClass.PROBLEM,
-            EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartBinarySensor(
-            coordinator, "is_fatal_err", "Критическая ошибка",
-            "is_fatal_err",
-            BinarySensorDeviceClass.PROBLEM,
-            EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartBinarySensor(
-            coordinator, "danger_overheat", "Угроза перегрева",
-            "danger_overheat",
-            BinarySensorDeviceClass.HEAT,
-            EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartBinarySensor(
-            coordinator, "change_filter", "Требуется замена фильтра",
-            "change_filter",
-            BinarySensorDeviceClass.PROBLEM,
-            EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartBinarySensor(
-            coordinator, "power", "Установка включена",
-            "power",
-            BinarySensorDeviceClass.RUNNING,
-        ),
-    ])
+    async_add_entities(
+        BreezartBinarySensor(coordinator, *row) for row in _BINARY_SENSORS
+    )
@@ -1,8 +1,10 @@
 """Climate platform for Breezart integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import Awaitable
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -13,18 +15,28 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MODE_MAP
+from .const import DEFAULT_TIMEOUT, DOMAIN, MODE_TO_HVAC, MODE_TO_HVAC_ACTION
 from .coordinator import BreezartDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 _OPTIMISTIC_HOLD_SECONDS = 6
 
+# HVAC mode -> Breezart mode sent with set_mode
+_HVAC_TO_BREEZART: dict[HVACMode, int] = {
+    HVACMode.HEAT: 0,
+    HVACMode.COOL: 1,
+    HVACMode.AUTO: 2,
+    HVACMode.FAN_ONLY: 3,
+}
+
+_FAN_MODES: tuple[str, ...] = tuple(str(i) for i in range(1, 9))
+
 
 class BreezartClimate(CoordinatorEntity[BreezartDataCoordinator], ClimateEntity):
     """Breezart climate entity (thermostat)."""
@@ -38,32 +50,85 @@ class BreezartClimate(CoordinatorEntity[BreezartDataCoordinator], ClimateEntity)
         | ClimateEntityFeature.TURN_ON
         | ClimateEntityFeature.TURN_OFF
     )
-    _attr_hvac_modes = [HVACMode.OFF, HVACMode.FAN_ONLY, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO]
-    _attr_fan_modes = ["1", "2", "3", "4", "5", "6", "7", "8"]
+    _attr_hvac_modes: tuple[HVACMode, ...] = (
+        HVACMode.OFF, HVACMode.FAN_ONLY, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO,
+    )
+    _attr_fan_modes: tuple[str, ...] = _FAN_MODES
 
     def __init__(self, coordinator: BreezartDataCoordinator) -> None:
         """Initialize the climate entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"breezart_{coordinator.client.host}_climate"
+        self._attr_unique_id = f"{coordinator.client.unique_id_prefix}climate"
         self._attr_min_temp = float(coordinator.client.temp_min)
         self._attr_max_temp = float(coordinator.client.temp_max)
         self._attr_target_temperature_step = 1.0
+        self._attr_device_info = coordinator.client.device_info
         # Optimistic state — applied immediately on command, confirmed by next poll
         self._optimistic_target_temp: float | None = None
         self._optimistic_fan_mode: str | None = None
         self._optimistic_hvac_mode: HVACMode | None = None
-        self._optimistic_set_time: float = 0.0
+        self._optimistic_expiry: float = 0.0
+        self._cancel_optimistic_hold: CALLBACK_TYPE | None = None
+
+    async def _async_send(self, command: Awaitable[None]) -> None:
+        """Await a client command, bounded by DEFAULT_TIMEOUT."""
+        try:
+            async with asyncio.timeout(DEFAULT_TIMEOUT):
+                await command
+        except TimeoutError as err:
+            raise TimeoutError(f"no response within {DEFAULT_TIMEOUT} s") from err
+
+    def _schedule_refresh(self) -> None:
+        """Request a debounced refresh without blocking the service call."""
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            f"breezart-refresh-{self.unique_id}",
+        )
+
+    def _start_optimistic_hold(self) -> None:
+        """Keep optimistic values for _OPTIMISTIC_HOLD_SECONDS from now.
+
+        A one-shot timer clears them when the hold ends, so the entity shows
+        device state again without waiting for the next coordinator push.
+        """
+        self._optimistic_expiry = time.monotonic() + _OPTIMISTIC_HOLD_SECONDS
+        if self._cancel_optimistic_hold:
+            self._cancel_optimistic_hold()
+        self._cancel_optimistic_hold = async_call_later(
+            self.hass, _OPTIMISTIC_HOLD_SECONDS, self._async_optimistic_hold_expired
+        )
+
+    def _clear_optimistic(self) -> None:
+        """Drop all optimistic values."""
+        self._optimistic_expiry = 0.0
+        self._optimistic_target_temp = None
+        self._optimistic_fan_mode = None
+        self._optimistic_hvac_mode = None
+
+    @callback
+    def _async_optimistic_hold_expired(self, _now: Any) -> None:
+        """Fall back to device state once the hold period ends."""
+        self._cancel_optimistic_hold = None
+        self._clear_optimistic()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending optimistic hold timer."""
+        if self._cancel_optimistic_hold:
+            self._cancel_optimistic_hold()
+            self._cancel_optimistic_hold = None
+        await super().async_will_remove_from_hass()
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Clear optimistic state only after hold period expires.
-        
+
         Keeps optimistic value visible for _OPTIMISTIC_HOLD_SECONDS after
         a command is sent, giving the device time to apply and confirm.
+        Once expired the check short-circuits without reading the clock.
         """
-        if time.monotonic() - self._optimistic_set_time > _OPTIMISTIC_HOLD_SECONDS:
-            self._optimistic_target_temp = None
-            self._optimistic_fan_mode = None
-            self._optimistic_hvac_mode = None
+        if self._optimistic_expiry and time.monotonic() >= self._optimistic_expiry:
+            self._clear_optimistic()
         super()._handle_coordinator_update()
 
     @property
@@ -101,17 +166,7 @@ class BreezartClimate(CoordinatorEntity[BreezartDataCoordinator], ClimateEntity)
         if not power:
             return HVACMode.OFF
 
-        mode = self.coordinator.data.get("mode", 0)
-        mode_name = MODE_MAP.get(mode, "").lower()
-
-        if "обогрев" in mode_name or "нагрев" in mode_name:
-            return HVACMode.HEAT
-        elif "охлаждение" in mode_name:
-            return HVACMode.COOL
-        elif "авто" in mode_name:
-            return HVACMode.AUTO
-        else:
-            return HVACMode.FAN_ONLY
+        return MODE_TO_HVAC.get(self.coordinator.data.get("mode", 0), HVACMode.FAN_ONLY)
 
     @property
     def hvac_action(self) -> HVACAction | None:
@@ -127,14 +182,9 @@ class BreezartClimate(CoordinatorEntity[BreezartDataCoordinator], ClimateEntity)
         if unit_state == 0:
             return HVACAction.OFF
         elif unit_state == 1:
-            mode = self.coordinator.data.get("mode", 0)
-            mode_name = MODE_MAP.get(mode, "").lower()
-            if "обогрев" in mode_name or "нагрев" in mode_name:
-                return HVACAction.HEATING
-            elif "охлаждение" in mode_name:
-                return HVACAction.COOLING
-            else:
-                return HVACAction.FAN
+            return MODE_TO_HVAC_ACTION.get(
+                self.coordinator.data.get("mode", 0), HVACAction.FAN
+            )
         else:
             return HVACAction.IDLE
 
@@ -154,45 +204,64 @@ class BreezartClimate(CoordinatorEntity[BreezartDataCoordinator], ClimateEntity)
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
+        if int(temperature) == self.target_temperature:
+            return
         # Optimistic: update UI immediately, device confirms within hold period
         self._optimistic_target_temp = float(temperature)
-        self._optimistic_set_time = time.monotonic()
+        self._start_optimistic_hold()
         self.async_write_ha_state()
         try:
-            await self.coordinator.client.set_temperature(int(temperature))
+            await self._async_send(self.coordinator.client.set_temperature(int(temperature)))
             _LOGGER.debug("Set temperature to %d°C", int(temperature))
         except Exception as err:
-            _LOGGER.error("Failed to set temperature: %s", err)
             self._optimistic_target_temp = None
             self.async_write_ha_state()
-            return
-        await self.coordinator.async_request_refresh()
+            raise HomeAssistantError(f"Failed to set temperature: {err}") from err
+        self._schedule_refresh()
+
+    def _device_powered(self) -> bool:
+        """Return whether the unit is on, counting a command still on hold."""
+        if self._optimistic_hvac_mode is not None:
+            return self._optimistic_hvac_mode != HVACMode.OFF
+        return bool(self.coordinator.data and self.coordinator.data.get("power"))
+
+    def _hvac_mode_applied(self, hvac_mode: HVACMode) -> bool:
+        """Return True if the device already runs as hvac_mode requests.
+
+        Compares the power and mode the command would change, not the derived
+        hvac_mode: mode 5 reads as OFF while the unit is still powered on.
+        """
+        if self._optimistic_hvac_mode is not None:
+            return hvac_mode == self._optimistic_hvac_mode
+        data = self.coordinator.data
+        if not data:
+            return False
+        if hvac_mode == HVACMode.OFF:
+            return not data.get("power", False)
+        return bool(data.get("power")) and MODE_TO_HVAC.get(data.get("mode")) == hvac_mode
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
+        if self._hvac_mode_applied(hvac_mode):
+            return
+        power_on = not self._device_powered()
         self._optimistic_hvac_mode = hvac_mode
-        self._optimistic_set_time = time.monotonic()
+        self._start_optimistic_hold()
         self.async_write_ha_state()
         try:
             if hvac_mode == HVACMode.OFF:
-                await self.coordinator.client.set_power(False)
+                await self._async_send(self.coordinator.client.set_power(False))
             else:
-                if not self.coordinator.data.get("power", False):
-                    await self.coordinator.client.set_power(True)
-                if hvac_mode == HVACMode.HEAT:
-                    await self.coordinator.client.set_mode(0)
-                elif hvac_mode == HVACMode.COOL:
-                    await self.coordinator.client.set_mode(1)
-                elif hvac_mode == HVACMode.AUTO:
-                    await self.coordinator.client.set_mode(2)
-                elif hvac_mode == HVACMode.FAN_ONLY:
-                    await self.coordinator.client.set_mode(3)
+                await self._async_send(
+                    self.coordinator.client.set_mode(
+                        _HVAC_TO_BREEZART[hvac_mode], power_on=power_on,
+                    )
+                )
         except Exception as err:
-            _LOGGER.error("Failed to set HVAC mode: %s", err)
             self._optimistic_hvac_mode = None
             self.async_write_ha_state()
-            return
-        await self.coordinator.async_request_refresh()
+            raise HomeAssistantError(f"Failed to set HVAC mode: {err}") from err
+        self._schedule_refresh()
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode (speed)."""
@@ -200,57 +269,46 @@ class BreezartClimate(CoordinatorEntity[BreezartDataCoordinator], ClimateEntity)
             speed = int(fan_mode)
         except ValueError:
             return
+        if fan_mode == self.fan_mode:
+            return
         # Optimistic: update UI immediately, device confirms within hold period
         self._optimistic_fan_mode = fan_mode
-        self._optimistic_set_time = time.monotonic()
+        self._start_optimistic_hold()
         self.async_write_ha_state()
         try:
-            await self.coordinator.client.set_fan_speed(speed)
+            await self._async_send(self.coordinator.client.set_fan_speed(speed))
             _LOGGER.debug("Set fan speed to %d", speed)
         except Exception as err:
-            _LOGGER.error("Failed to set fan speed: %s", err)
             self._optimistic_fan_mode = None
             self.async_write_ha_state()
-            return
-        await self.coordinator.async_request_refresh()
+            raise HomeAssistantError(f"Failed to set fan speed: {err}") from err
+        self._schedule_refresh()
 
     async def async_turn_on(self) -> None:
         """Turn on."""
         self._optimistic_hvac_mode = HVACMode.HEAT
-        self._optimistic_set_time = time.monotonic()
+        self._start_optimistic_hold()
         self.async_write_ha_state()
         try:
-            await self.coordinator.client.set_power(True)
+            await self._async_send(self.coordinator.client.set_power(True))
         except Exception as err:
-            _LOGGER.error("Failed to turn on: %s", err)
             self._optimistic_hvac_mode = None
             self.async_write_ha_state()
-            return
-        await self.coordinator.async_request_refresh()
+            raise HomeAssistantError(f"Failed to turn on: {err}") from err
+        self._schedule_refresh()
 
     async def async_turn_off(self) -> None:
         """Turn off."""
         self._optimistic_hvac_mode = HVACMode.OFF
-        self._optimistic_set_time = time.monotonic()
+        self._start_optimistic_hold()
         self.async_write_ha_state()
         try:
-            await self.coordinator.client.set_power(False)
+            await self._async_send(self.coordinator.client.set_power(False))
         except Exception as err:
-            _LOGGER.error("Failed to turn off: %s", err)
             self._optimistic_hvac_mode = None
             self.async_write_ha_state()
-            return
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.client.host)},
-            name="Breezart",
-            manufacturer="Breezart",
-            model="550 Aqua",
-        )
+            raise HomeAssistantError(f"Failed to turn off: {err}") from err
+        self._schedule_refresh()
 
 
 async def async_setup_entry(
@@ -1,6 +1,7 @@
 """Config flow for Breezart integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import voluptuous as vol
@@ -8,7 +9,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_PASSWORD
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DEFAULT_PORT, DOMAIN
+from .const import DEFAULT_PORT, DEFAULT_TIMEOUT, DOMAIN
 from .coordinator import BreezartTCPClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,6 +25,15 @@ class BreezartConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._port: int = DEFAULT_PORT
         self._password: str | None = None
 
+    @staticmethod
+    async def _async_test_connection(client: BreezartTCPClient) -> None:
+        """Connect and read device properties, always closing the socket."""
+        try:
+            await client.connect()
+            await client.get_properties()
+        finally:
+            await client.disconnect()
+
     async def async_step_user(
         self, user_input: dict[str, str] | None = None
     ) -> FlowResult:
@@ -42,9 +52,8 @@ class BreezartConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     port=self._port,
                     password=int(self._password),
                 )
-                await client.connect()
-                await client.get_properties()
-                await client.disconnect()
+                async with asyncio.timeout(DEFAULT_TIMEOUT):
+                    await self._async_test_connection(client)
             except TimeoutError as err:
                 _LOGGER.error("Connection timeout: %s", err)
                 errors["base"] = "cannot_connect"
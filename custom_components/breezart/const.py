@@ -1,4 +1,8 @@
 """Constants for Breezart integration."""
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from homeassistant.components.climate import HVACAction, HVACMode
 
 DOMAIN = "breezart"
 DEFAULT_NAME = "Breezart"
@@ -6,7 +10,8 @@ DEFAULT_NAME = "Breezart"
 # Breezart TCP connection settings
 DEFAULT_PORT = 1560
 DEFAULT_TIMEOUT = 5
-DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_SCAN_INTERVAL = 30  # Sensors (VSens) change slowly
+STATE_SCAN_INTERVAL = 3  # State (VSt07) follows panel changes
 
 # Protocol delimiter
 DELIMITER = "_"
@@ -43,40 +48,59 @@ POWER_OFF = 0
 NO_DATA_VALUE = 0xFB07
 
 # UnitState values
-UNIT_STATE_MAP = {
+UNIT_STATE_MAP: Mapping[int, str] = MappingProxyType({
     0: "Выключено",
     1: "Включено",
     2: "Выключение",
     3: "Включение",
-}
+})
 
 # Mode values
-MODE_MAP = {
+MODE_MAP: Mapping[int, str] = MappingProxyType({
     0: "Обогрев",
     1: "Охлаждение",
     2: "Авто-Обогрев",
     3: "Авто-Охлаждение",
     4: "Вентиляция",
     5: "Выключено",
+})
+
+# Mode -> Home Assistant HVAC mode / action (while the unit is running)
+MODE_TO_HVAC: dict[int, HVACMode] = {
+    0: HVACMode.HEAT,
+    1: HVACMode.COOL,
+    2: HVACMode.AUTO,
+    3: HVACMode.AUTO,
+    4: HVACMode.FAN_ONLY,
+    5: HVACMode.OFF,
+}
+
+MODE_TO_HVAC_ACTION: dict[int, HVACAction] = {
+    0: HVACAction.HEATING,
+    1: HVACAction.COOLING,
+    2: HVACAction.HEATING,
+    3: HVACAction.COOLING,
+    4: HVACAction.FAN,
+    5: HVACAction.FAN,
 }
 
 # ModeSet values (requested/set mode)
-MODE_SET_MAP = {
+MODE_SET_MAP: Mapping[int, str] = MappingProxyType({
     1: "Обогрев",
     2: "Охлаждение",
     3: "Авто",
     4: "Вентиляция",
-}
+})
 
 # ColorMsg / ColorInd
-COLOR_MSG_MAP = {
+COLOR_MSG_MAP: Mapping[int, str] = MappingProxyType({
     0: "Норма",
     1: "Предупреждение",
     2: "Ошибка",
-}
+})
 
-COLOR_IND_MAP = {
+COLOR_IND_MAP: Mapping[int, str] = MappingProxyType({
     0: "Выключено",
     1: "Переходный процесс",
     2: "Включено",
-}
+})
@@ -3,10 +3,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import socket
+import time
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -29,24 +34,61 @@ from .const import (
     RESP_PROPERTIES,
     RESP_SENSORS,
     RESP_STATE,
+    STATE_SCAN_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Requests are tiny (~15 bytes), so disable Nagle to send each one immediately.
+# TCP_QUICKACK (Linux only) stops the delayed ACK on the response path.
+DEFAULT_SOCKET_OPTIONS: list[tuple[int, int, int]] = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+]
+_QUICKACK_OPTION: tuple[int, int, int] | None = None
+if hasattr(socket, "TCP_QUICKACK"):
+    _QUICKACK_OPTION = (socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    DEFAULT_SOCKET_OPTIONS.append(_QUICKACK_OPTION)
 
-def _dec_to_hex(value: int) -> str:
-    """Convert decimal integer to hex string (like breezart-client decToHex)."""
+
+# Responses are handled as bytes end to end; int(..., 16) accepts bytes directly
+_NO_DATA_HEX = format(NO_DATA_VALUE, "x").encode()
+_DELIMITER_B = DELIMITER.encode()
+_RESP_OK_B = RESP_OK.encode()
+_RESP_PROPERTIES_B = RESP_PROPERTIES.encode()
+_RESP_SENSORS_B = RESP_SENSORS.encode()
+_RESP_STATE_B = RESP_STATE.encode()
+_ERROR_PREFIX_B = {code.encode(): text for code, text in ERROR_PREFIX.items()}
+
+
+# Command data (power, mode, speed, temperature) always fits in a byte
+_HEX_LUT: tuple[str, ...] = tuple(format(i, "x") for i in range(256))
+
+
+def _check_value(value: int) -> int:
+    """Validate a password or request data value before it is sent."""
     if not isinstance(value, int) or value < 0 or value > 65535:
         raise ValueError(f"Value must be a positive integer <= 65535, got {value}")
-    return format(value, "x")
+    return value
+
+
+def _dec_to_hex(value: int) -> str:
+    """Convert decimal integer to hex string (like breezart-client decToHex).
+
+    Byte values come from the lookup table; anything else goes through
+    _check_value, so bad request data (out of range or not an int) raises
+    ValueError instead of being sent as a wrong frame.
+    """
+    if isinstance(value, int) and 0 <= value < 256:
+        return _HEX_LUT[value]
+    return format(_check_value(value), "x")
 
 
-def _hex_to_dec(hex_str: str) -> int:
+def _hex_to_dec(hex_str: bytes) -> int:
     """Convert hex string to unsigned decimal."""
     return int(hex_str, 16)
 
 
-def _hex_to_dec_sign(hex_str: str) -> int:
+def _hex_to_dec_sign(hex_str: bytes) -> int:
     """Convert hex string to signed decimal (signed 16-bit)."""
     val = int(hex_str, 16)
     if val & 0x8000:
@@ -54,16 +96,48 @@ def _hex_to_dec_sign(hex_str: str) -> int:
     return val
 
 
-def _parse_bits(hex_str: str, from_bit: int, to_bit: int | None = None) -> int:
-    """Extract bits from a hex string (like breezart-client parceBits)."""
-    if to_bit is None:
-        to_bit = from_bit
-    if hex_str == "0":
-        return 0
-    num = int(hex_str, 16)
-    bits = format(num, "016b")[::-1]
-    extracted = bits[from_bit: to_bit + 1][::-1]
-    return int(extracted, 2)
+def _bit(num: int, bit: int) -> int:
+    """Return a single bit of an already parsed field."""
+    return (num >> bit) & 1
+
+
+def _bits(num: int, from_bit: int, to_bit: int) -> int:
+    """Extract bits from an already parsed field (like breezart-client parceBits)."""
+    return (num >> from_bit) & ((1 << (to_bit - from_bit + 1)) - 1)
+
+
+class _BreezartProtocol(asyncio.Protocol):
+    """Collect bytes from the Breezart socket into one reusable buffer."""
+
+    def __init__(self) -> None:
+        """Initialize the protocol."""
+        self.buffer = bytearray()
+        self.closed = False
+        self._waiter: asyncio.Future[None] | None = None
+
+    def data_received(self, data: bytes) -> None:
+        """Append incoming data and wake a pending reader."""
+        self.buffer += data
+        self._wake()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Mark the connection closed and wake a pending reader."""
+        self.closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def wait_for_data(self) -> None:
+        """Return once the buffer holds data or the connection is closed."""
+        if self.buffer or self.closed:
+            return
+        self._waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
 
 
 class BreezartTCPClient:
@@ -75,14 +149,28 @@ class BreezartTCPClient:
         port: int,
         password: int | str,
         timeout: int = DEFAULT_TIMEOUT,
+        socket_options: list[tuple[int, int, int]] | None = None,
     ) -> None:
-        """Initialize the TCP client."""
+        """Initialize the TCP client.
+
+        socket_options is a list of (level, optname, value) tuples applied to
+        the socket on connect, e.g. to add TCP_KEEPIDLE or TCP_USER_TIMEOUT.
+        Defaults to DEFAULT_SOCKET_OPTIONS.
+        """
         self.host = host
         self.port = port
         self.password = int(password)
+        self._password_hex = _dec_to_hex(_check_value(self.password))
         self.timeout = timeout
-        self._reader: asyncio.StreamReader | None = None
-        self._writer: asyncio.StreamWriter | None = None
+        self.socket_options = (
+            list(DEFAULT_SOCKET_OPTIONS) if socket_options is None else socket_options
+        )
+        self._transport: asyncio.Transport | None = None
+        self._protocol: _BreezartProtocol | None = None
+        # Serializes request/response exchanges on the shared connection
+        self._lock = asyncio.Lock()
+        # Linux may fall back to delayed ACKs, so QUICKACK is re-armed per request
+        self._quickack = _QUICKACK_OPTION is not None and _QUICKACK_OPTION in self.socket_options
 
         # Device properties (populated on first connect)
         self.temp_min: int = 15
@@ -93,106 +181,219 @@ class BreezartTCPClient:
         self.has_humidifier: bool = False
         self.firmware_ver: int | None = None
         self.protocol_ver: str | None = None
+        self.properties_loaded = False
+        self.properties: dict[str, Any] = {}
+
+        # Shared by every entity of this unit
+        self.unique_id_prefix = f"breezart_{host}_"
+        self._device_info: DeviceInfo | None = None
+
+        # The password is fixed, so parameter-less requests are encoded once
+        self._req_properties = self._build_request(REQ_GET_PROPERTIES).encode()
+        self._req_state = self._build_request(REQ_GET_STATE).encode()
+        self._req_sensors = self._build_request(REQ_GET_SENSORS).encode()
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the TCP connection is open."""
+        return self._transport is not None and not self._transport.is_closing()
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information, built once per set of properties."""
+        if self._device_info is None:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.host)},
+                name="Breezart",
+                manufacturer="Breezart",
+                model="550 Aqua",
+                sw_version=str(self.firmware_ver or ""),
+            )
+        return self._device_info
 
     def _build_request(self, request_type: str, data: int | None = None) -> str:
         """Build a request string: requestType_password[_data]."""
-        parts = [request_type, _dec_to_hex(self.password)]
-        if data is not None:
-            parts.append(_dec_to_hex(data))
-        return DELIMITER.join(parts)
-
-    def _split_response(self, message: str) -> list[str]:
+        if data is None:
+            return f"{request_type}{DELIMITER}{self._password_hex}"
+        return f"{request_type}{DELIMITER}{self._password_hex}{DELIMITER}{_dec_to_hex(data)}"
+
+    @staticmethod
+    def _redact(request: str | bytes) -> str:
+        """Return the request with the password masked, for logs and errors."""
+        if isinstance(request, bytes):
+            request = request.decode()
+        request_type, _, rest = request.partition(DELIMITER)
+        _, _, data = rest.partition(DELIMITER)
+        return DELIMITER.join(part for part in (request_type, "***", data) if part)
+
+    def _split_response(self, message: bytes) -> list[bytes]:
         """Split response by delimiter, removing empty parts."""
-        return [v for v in message.split(DELIMITER) if v]
+        return [v for v in message.split(_DELIMITER_B) if v]
 
-    def _check_error(self, parts: list[str]) -> None:
+    def _check_error(self, parts: list[bytes]) -> None:
         """Raise if response indicates an error."""
-        if parts and parts[0] in ERROR_PREFIX:
-            raise PermissionError(f"Breezart error: {ERROR_PREFIX[parts[0]]} ({DELIMITER.join(parts)})")
+        if parts and parts[0] in _ERROR_PREFIX_B:
+            raw = _DELIMITER_B.join(parts).decode(errors="replace")
+            raise PermissionError(f"Breezart error: {_ERROR_PREFIX_B[parts[0]]} ({raw})")
 
     async def connect(self) -> None:
         """Open TCP connection."""
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
-                timeout=self.timeout,
-            )
+            loop = asyncio.get_running_loop()
+            async with asyncio.timeout(self.timeout):
+                self._transport, self._protocol = await loop.create_connection(
+                    _BreezartProtocol, self.host, self.port
+                )
+            self._apply_socket_options()
             _LOGGER.info("Connected to Breezart at %s:%d", self.host, self.port)
         except (OSError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to connect to Breezart: %s", err)
             raise
 
+    def _apply_socket_options(
+        self, options: list[tuple[int, int, int]] | None = None
+    ) -> None:
+        """Apply socket options (default: the configured ones) to the connection."""
+        sock = self._transport.get_extra_info("socket") if self._transport else None
+        if sock is None:
+            return
+        for level, optname, value in self.socket_options if options is None else options:
+            try:
+                sock.setsockopt(level, optname, value)
+            except OSError as err:
+                _LOGGER.debug("Failed to set socket option %s/%s: %s", level, optname, err)
+
     async def disconnect(self) -> None:
         """Close TCP connection."""
-        if self._writer:
-            try:
-                self._writer.close()
-                await self._writer.wait_closed()
-            except Exception:
-                pass
-            self._writer = None
-            self._reader = None
-
-    async def _send(self, request: str) -> list[str]:
+        self._drop_connection()
+
+    def _drop_connection(self) -> None:
+        """Close the socket without waiting, e.g. after a cancelled exchange."""
+        if self._transport:
+            self._transport.close()
+        self._transport = None
+        self._protocol = None
+
+    async def _ensure_connected(self) -> None:
+        """Reopen the connection if it was closed or dropped (lock must be held).
+
+        The connection is long-lived and shared by polls and commands; after
+        the device resets it, the next request reconnects lazily.
+        """
+        if not self.connected:
+            await self.connect()
+
+    async def _send(self, request: str | bytes) -> list[bytes]:
         """Send a request and return split response."""
-        if not self._writer or not self._reader:
+        async with self._lock:
+            await self._ensure_connected()
+            try:
+                return await self._send_locked(request)
+            except asyncio.CancelledError:
+                # The reply may still arrive and would be read as the answer
+                # to the next request, so start over on a fresh connection.
+                self._drop_connection()
+                raise
+
+    async def send_batch(self, requests: list[str | bytes]) -> list[list[bytes]]:
+        """Send several requests back-to-back and return their responses.
+
+        The device has no request framing, so frames can't share one write;
+        instead the connection is held for the whole batch, so a poll can't
+        get in between and the requests go out one after another.
+        """
+        async with self._lock:
+            await self._ensure_connected()
+            try:
+                return [await self._send_locked(request) for request in requests]
+            except asyncio.CancelledError:
+                self._drop_connection()
+                raise
+
+    async def _send_locked(self, request: str | bytes) -> list[bytes]:
+        """Send a request and return split response (lock must be held)."""
+        if not self.connected or self._protocol is None:
             raise ConnectionError("Not connected to Breezart")
+        protocol = self._protocol
 
-        _LOGGER.debug("Breezart TX: %s", request)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Breezart TX: %s", self._redact(request))
+        # Drop anything left over so it can't be taken for this reply
+        protocol.buffer.clear()
         # Send WITHOUT newline (like breezart-client)
-        self._writer.write(request.encode())
-        await self._writer.drain()
+        if self._quickack:
+            self._apply_socket_options([_QUICKACK_OPTION])
+        self._transport.write(request if isinstance(request, bytes) else request.encode())
 
         # Breezart doesn't send \n, so read available data with small delay
         # Wait a bit for data to arrive
         await asyncio.sleep(0.03)
-        
-        response = ""
+
         try:
-            # Read whatever is available (up to 4KB)
-            raw = await asyncio.wait_for(
-                self._reader.read(4096),
-                timeout=self.timeout
-            )
-            if not raw:
-                raise TimeoutError(f"No response for request: {request}")
-            response = raw.decode().strip()
-        except asyncio.TimeoutError:
-            raise TimeoutError(f"No response for request: {request}")
-        except Exception as e:
-            raise ConnectionError(f"Error reading response: {e}")
+            async with asyncio.timeout(self.timeout):
+                await protocol.wait_for_data()
+        except TimeoutError:
+            raise TimeoutError(f"No response for request: {self._redact(request)}")
+        if not protocol.buffer:
+            raise ConnectionError(f"Connection closed before response to: {self._redact(request)}")
+
+        response = bytes(protocol.buffer).strip()
+        protocol.buffer.clear()
 
         if not response:
-            raise TimeoutError(f"Empty response for request: {request}")
+            raise TimeoutError(f"Empty response for request: {self._redact(request)}")
 
-        _LOGGER.debug("Breezart RX: %s", response)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Breezart RX: %s", response.decode(errors="replace"))
         parts = self._split_response(response)
         self._check_error(parts)
         return parts
 
-    async def get_properties(self) -> None:
-        """Read device properties (VPr07). Called once after connect."""
-        req = self._build_request(REQ_GET_PROPERTIES)
-        parts = await self._send(req)
+    async def get_properties(self, force: bool = False) -> None:
+        """Read device properties (VPr07).
+
+        The limits are fixed for a unit, so after the first successful read
+        this is a no-op (also across reconnects) unless force is set.
+        """
+        if self.properties_loaded and not force:
+            return
+        parts = await self._send(self._req_properties)
 
-        if not parts or parts[0] != RESP_PROPERTIES:
+        if not parts or parts[0] != _RESP_PROPERTIES_B:
             raise ValueError(f"Unexpected properties response: {parts}")
 
+        bit_tempr = _hex_to_dec(parts[1])
+        bit_speed = _hex_to_dec(parts[2])
+        bit_misc = _hex_to_dec(parts[4])
+        bit_prt = _hex_to_dec(parts[5])
+
         # bitTempr: Bit 7-0 TempMin, Bit 15-8 TempMax
-        self.temp_min = _parse_bits(parts[1], 0, 7)
-        self.temp_max = _parse_bits(parts[1], 8, 15)
+        self.temp_min = _bits(bit_tempr, 0, 7)
+        self.temp_max = _bits(bit_tempr, 8, 15)
         # bitSpeed: Bit 7-0 SpeedMin, Bit 15-8 SpeedMax
-        self.speed_min = _parse_bits(parts[2], 0, 7)
-        self.speed_max = _parse_bits(parts[2], 8, 15)
+        self.speed_min = _bits(bit_speed, 0, 7)
+        self.speed_max = _bits(bit_speed, 8, 15)
         # bitMisc: Bit 14 IsCooler, Bit 13 IsHumid
-        self.has_cooler = bool(_parse_bits(parts[4], 14))
-        self.has_humidifier = bool(_parse_bits(parts[4], 13))
+        self.has_cooler = bool(_bit(bit_misc, 14))
+        self.has_humidifier = bool(_bit(bit_misc, 13))
         # BitPrt: protocol version
-        sub = _parse_bits(parts[5], 0, 7)
-        major = _parse_bits(parts[5], 8, 15)
+        sub = _bits(bit_prt, 0, 7)
+        major = _bits(bit_prt, 8, 15)
         self.protocol_ver = f"{major}.{sub}"
         # BitVerContr: firmware
         self.firmware_ver = _hex_to_dec(parts[7])
+        self.properties_loaded = True
+        self.properties = {
+            "temp_min": self.temp_min,
+            "temp_max": self.temp_max,
+            "speed_min": self.speed_min,
+            "speed_max": self.speed_max,
+            "has_cooler": self.has_cooler,
+            "has_humidifier": self.has_humidifier,
+            "firmware_ver": self.firmware_ver,
+            "protocol_ver": self.protocol_ver,
+        }
+        self._device_info = None
 
         _LOGGER.info(
             "Breezart properties: T=%d..%d°C, Speed=%d..%d, fw=%s, proto=%s",
@@ -203,46 +404,56 @@ class BreezartTCPClient:
 
     async def get_state(self) -> dict[str, Any]:
         """Read current state (VSt07)."""
-        req = self._build_request(REQ_GET_STATE)
-        parts = await self._send(req)
+        return self._parse_state(await self._send(self._req_state))
 
-        if not parts or parts[0] != RESP_STATE:
+    @staticmethod
+    def _parse_state(parts: list[bytes]) -> dict[str, Any]:
+        """Parse a VSt07 response."""
+        if not parts or parts[0] != _RESP_STATE_B:
             raise ValueError(f"Unexpected state response: {parts}")
 
+        # Parse each packed field once, then slice bits out of the integers
+        bit_state = _hex_to_dec(parts[1])
+        bit_mode = _hex_to_dec(parts[2])
+        bit_tempr = _hex_to_dec(parts[3])
+        bit_humid = _hex_to_dec(parts[4])
+        bit_speed = _hex_to_dec(parts[5])
+        bit_misc = _hex_to_dec(parts[6])
+
         # bitState
-        pwr_btn_state = _parse_bits(parts[1], 0)
-        is_warn_err = bool(_parse_bits(parts[1], 1))
-        is_fatal_err = bool(_parse_bits(parts[1], 2))
-        danger_overheat = bool(_parse_bits(parts[1], 3))
-        change_filter = bool(_parse_bits(parts[1], 5))
-        mode_set = _parse_bits(parts[1], 6, 8)
+        pwr_btn_state = _bit(bit_state, 0)
+        is_warn_err = bool(_bit(bit_state, 1))
+        is_fatal_err = bool(_bit(bit_state, 2))
+        danger_overheat = bool(_bit(bit_state, 3))
+        change_filter = bool(_bit(bit_state, 5))
+        mode_set = _bits(bit_state, 6, 8)
 
         # bitMode
-        unit_state = _parse_bits(parts[2], 0, 1)
-        mode = _parse_bits(parts[2], 3, 5)
+        unit_state = _bits(bit_mode, 0, 1)
+        mode = _bits(bit_mode, 3, 5)
 
         # bitTempr: Bit 7-0 current (signed), Bit 15-8 target
-        tempr_raw = _parse_bits(parts[3], 0, 7)
+        tempr_raw = _bits(bit_tempr, 0, 7)
         tempr = tempr_raw if tempr_raw < 128 else tempr_raw - 256
-        temper_target = _parse_bits(parts[3], 8, 15)
+        temper_target = _bits(bit_tempr, 8, 15)
 
         # bitHumid
-        humid = _parse_bits(parts[4], 0, 7)
+        humid = _bits(bit_humid, 0, 7)
         humid = None if humid == 255 else humid
 
         # bitSpeed
-        speed = _parse_bits(parts[5], 0, 3)
-        speed_target = _parse_bits(parts[5], 4, 7)
-        speed_fact = _parse_bits(parts[5], 8, 15)
+        speed = _bits(bit_speed, 0, 3)
+        speed_target = _bits(bit_speed, 4, 7)
+        speed_fact = _bits(bit_speed, 8, 15)
         speed_fact = None if speed_fact == 255 else speed_fact
 
         # bitMisc
-        color_msg = _parse_bits(parts[6], 4, 5)
-        color_ind = _parse_bits(parts[6], 6, 7)
-        filter_dust = _parse_bits(parts[6], 8, 15)
+        color_msg = _bits(bit_misc, 4, 5)
+        color_ind = _bits(bit_misc, 6, 7)
+        filter_dust = _bits(bit_misc, 8, 15)
         filter_dust = None if filter_dust == 255 else filter_dust
 
-        msg = parts[10] if len(parts) > 10 else None
+        msg = parts[10].decode(errors="replace") if len(parts) > 10 else None
 
         return {
             "power": bool(pwr_btn_state),
@@ -267,21 +478,24 @@ class BreezartTCPClient:
 
     async def get_sensors(self) -> dict[str, Any]:
         """Read sensor values (VSens)."""
-        req = self._build_request(REQ_GET_SENSORS)
-        parts = await self._send(req)
+        return self._parse_sensors(await self._send(self._req_sensors))
 
-        if not parts or parts[0] != RESP_SENSORS:
+    @staticmethod
+    def _parse_sensors(parts: list[bytes]) -> dict[str, Any]:
+        """Parse a VSens response."""
+        if not parts or parts[0] != _RESP_SENSORS_B:
             raise ValueError(f"Unexpected sensors response: {parts}")
 
-        _LOGGER.debug("VSens parts count: %d, parts: %s", len(parts), parts)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("VSens parts count: %d, parts: %s", len(parts), parts)
 
-        def _parse_temp_sensor(val: str) -> float | None:
-            if val == "fb07":
+        def _parse_temp_sensor(val: bytes) -> float | None:
+            if val == _NO_DATA_HEX:
                 return None
             return _hex_to_dec_sign(val) / 10.0
 
-        def _parse_sensor(val: str) -> float | None:
-            if val == "fb07":
+        def _parse_sensor(val: bytes) -> float | None:
+            if val == _NO_DATA_HEX:
                 return None
             return float(_hex_to_dec(val))
 
@@ -320,40 +534,69 @@ class BreezartTCPClient:
             "filter4_pollution": filter4,
         }
 
+    async def poll_all(
+        self, include_sensors: bool = True
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        """Read state and, optionally, sensors in a single batch."""
+        requests: list[str | bytes] = [self._req_state]
+        if include_sensors:
+            requests.append(self._req_sensors)
+        responses = await self.send_batch(requests)
+        state = self._parse_state(responses[0])
+        sensors = self._parse_sensors(responses[1]) if include_sensors else None
+        return state, sensors
+
     async def set_power(self, on: bool) -> None:
         """Turn device on or off (VWPwr)."""
         data = POWER_ON if on else POWER_OFF
         req = self._build_request(REQ_SET_POWER, data)
         parts = await self._send(req)
-        if not parts or parts[0] != RESP_OK:
+        if not parts or parts[0] != _RESP_OK_B:
             raise ValueError(f"Unexpected set_power response: {parts}")
 
     async def set_temperature(self, temperature: int) -> None:
         """Set target temperature (VWTmp). Must be integer degrees."""
-        req = self._build_request(REQ_SET_TEMP, temperature)
+        req = self._build_request(REQ_SET_TEMP, _check_value(temperature))
         parts = await self._send(req)
-        if not parts or parts[0] != RESP_OK:
+        if not parts or parts[0] != _RESP_OK_B:
             raise ValueError(f"Unexpected set_temperature response: {parts}")
 
     async def set_fan_speed(self, speed: int) -> None:
         """Set fan speed 0-10 (VWSpd)."""
-        req = self._build_request(REQ_SET_FAN_SPEED, speed)
+        req = self._build_request(REQ_SET_FAN_SPEED, _check_value(speed))
         parts = await self._send(req)
-        if not parts or parts[0] != RESP_OK:
+        if not parts or parts[0] != _RESP_OK_B:
             raise ValueError(f"Unexpected set_fan_speed response: {parts}")
 
-    async def set_mode(self, mode: int) -> None:
-        """Set work mode (VWFtr). 1=Heat, 2=Cool, 3=Auto, 4=Vent."""
-        req = self._build_request(REQ_SET_MODE, mode)
-        parts = await self._send(req)
-        if not parts or parts[0] != RESP_OK:
-            raise ValueError(f"Unexpected set_mode response: {parts}")
+    async def set_mode(self, mode: int, power_on: bool = False) -> None:
+        """Set work mode (VWFtr). 1=Heat, 2=Cool, 3=Auto, 4=Vent.
+
+        With power_on, the unit is switched on in the same batch first.
+        """
+        requests: list[str | bytes] = [self._build_request(REQ_SET_MODE, _check_value(mode))]
+        if power_on:
+            requests.insert(0, self._build_request(REQ_SET_POWER, POWER_ON))
+        for parts in await self.send_batch(requests):
+            if not parts or parts[0] != _RESP_OK_B:
+                raise ValueError(f"Unexpected set_mode response: {parts}")
+
+
+# Queued coordinator write: (client setter, value, future its callers await)
+_PendingWrite = tuple[Callable[[int], Awaitable[None]], int, asyncio.Future[None]]
+
+
+def _retrieve_exception(future: asyncio.Future[None]) -> None:
+    """Mark a write's failure as seen, even if every caller was cancelled."""
+    if not future.cancelled():
+        future.exception()
 
 
 class BreezartDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator that polls Breezart for state and sensor data."""
 
-    SENSORS_UPDATE_INTERVAL = 30  # Poll sensors less frequently than state
+    SENSORS_UPDATE_INTERVAL = DEFAULT_SCAN_INTERVAL  # Poll sensors less frequently than state
+    REFRESH_COOLDOWN = 0.5  # Collapse bursts of command refreshes into one poll
+    WRITE_COALESCE_DELAY = 0.05  # Gather writes fired together by one UI action
 
     def __init__(self, hass: HomeAssistant, client: BreezartTCPClient) -> None:
         """Initialize the coordinator."""
@@ -361,12 +604,111 @@ class BreezartDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=3),
+            update_interval=timedelta(seconds=STATE_SCAN_INTERVAL),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=self.REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.client = client
-        self._properties_loaded = False
         self._cached_sensors: dict[str, Any] = {}
-        self._sensors_update_counter = 0
+        self._sensors_next_update = 0.0
+        self._pending_writes: dict[str, _PendingWrite] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        # Keys whose value changed in the latest update; None means "assume all"
+        self.changed_keys: frozenset[str] | None = None
+
+    def _changed_since_last(self, data: dict[str, Any]) -> frozenset[str] | None:
+        """Return the keys of data that differ from the current data.
+
+        Returns None when there is nothing trustworthy to compare against
+        (first update, or recovering from a failed one), so every entity
+        writes its state.
+        """
+        old = self.data
+        if old is None or old is data or not self.last_update_success:
+            return None
+        return frozenset(key for key, value in data.items() if old.get(key) != value)
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Publish locally updated data, tracking which keys changed."""
+        self.changed_keys = self._changed_since_last(data)
+        super().async_set_updated_data(data)
+
+    async def queue_write(
+        self, key: str, write: Callable[[int], Awaitable[None]], value: int
+    ) -> None:
+        """Queue a device write and wait until it has been sent.
+
+        Writes queued within WRITE_COALESCE_DELAY are sent together in queue
+        order, followed by a single refresh. A newer write for the same key
+        replaces the pending one, and its callers share the outcome. Each
+        key gets its own result, so one failing write neither stops the
+        others nor is reported to their callers.
+        """
+        pending = self._pending_writes.get(key)
+        if pending:
+            future = pending[2]
+        else:
+            future = self.hass.loop.create_future()
+            future.add_done_callback(_retrieve_exception)
+        self._pending_writes[key] = (write, value, future)
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush_writes(), "breezart-flush-writes"
+            )
+        await asyncio.shield(future)
+
+    async def _async_flush_writes(self) -> None:
+        """Send queued writes one by one until none are left, then refresh once.
+
+        Writes queued while a batch is being sent are coalesced into the next
+        batch of the same flush, so only one flush task exists at a time.
+        """
+        writes: dict[str, _PendingWrite] = {}
+        try:
+            while self._pending_writes:
+                await asyncio.sleep(self.WRITE_COALESCE_DELAY)
+                writes, self._pending_writes = self._pending_writes, {}
+                for write, value, future in writes.values():
+                    try:
+                        await write(value)
+                    except Exception as err:
+                        future.set_exception(err)
+                    else:
+                        future.set_result(None)
+        finally:
+            self._flush_task = None
+            # Fail writes that were never sent, e.g. when unloading cancelled the flush
+            for _write, _value, future in (*writes.values(), *self._pending_writes.values()):
+                if not future.done():
+                    future.set_exception(ConnectionError("Breezart write was not sent"))
+            self._pending_writes = {}
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Stop queued writes, then close the connection.
+
+        The client reconnects on demand, so a write or refresh left running
+        after unload would reopen the socket; the flush is stopped first.
+        """
+        if (task := self._flush_task) is not None:
+            task.cancel()
+            await asyncio.wait([task])
+        await super().async_shutdown()
+        await self.client.disconnect()
+
+    async def _async_setup(self) -> None:
+        """Connect and read the device properties once, before the first refresh.
+
+        Device limits are fixed, so they are not part of the periodic poll.
+        """
+        try:
+            await self.client.connect()
+            await self.client.get_properties()
+        except (ConnectionError, OSError, TimeoutError, ValueError) as err:
+            await self.client.disconnect()
+            raise UpdateFailed(f"Cannot read Breezart properties: {err}") from err
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch latest data from Breezart.
@@ -376,43 +718,34 @@ class BreezartDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         change slowly.
         """
         try:
-            if not self.client._writer:
-                await self.client.connect()
-
-            if not self._properties_loaded:
-                await self.client.get_properties()
-                self._properties_loaded = True
-
-            # Always fetch state — this contains temperature, speed, mode
-            state = await self.client.get_state()
-
-            # Fetch sensors only every SENSORS_UPDATE_INTERVAL seconds
-            self._sensors_update_counter += 1
-            cycles_per_sensor_update = self.SENSORS_UPDATE_INTERVAL // 3
-            if self._sensors_update_counter >= cycles_per_sensor_update or not self._cached_sensors:
-                self._cached_sensors = await self.client.get_sensors()
-                self._sensors_update_counter = 0
+            # Always fetch state — this contains temperature, speed, mode.
+            # Sensors are fetched in the same batch every SENSORS_UPDATE_INTERVAL
+            # seconds of wall time, so extra refreshes after commands don't
+            # pull them in early.
+            now = time.monotonic()
+            refresh_sensors = now >= self._sensors_next_update or not self._cached_sensors
+            state, sensors = await self.client.poll_all(include_sensors=refresh_sensors)
+            if sensors is not None:
+                self._cached_sensors = sensors
+                self._sensors_next_update = now + self.SENSORS_UPDATE_INTERVAL
                 _LOGGER.debug("Breezart sensors refreshed")
 
-            data = {**state, **self._cached_sensors}
-
-            data["temp_min"] = self.client.temp_min
-            data["temp_max"] = self.client.temp_max
-            data["speed_min"] = self.client.speed_min
-            data["speed_max"] = self.client.speed_max
-            data["has_cooler"] = self.client.has_cooler
-            data["has_humidifier"] = self.client.has_humidifier
-            data["firmware_ver"] = self.client.firmware_ver
-            data["protocol_ver"] = self.client.protocol_ver
+            # The freshly parsed state dict becomes the result
+            data = state
+            data.update(self._cached_sensors)
+            data.update(self.client.properties)
 
-            _LOGGER.debug("Breezart state update: power=%s temp=%s speed=%s",
-                          data.get("power"), data.get("temperature_target"), data.get("speed_target"))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Breezart state update: power=%s temp=%s speed=%s",
+                              data.get("power"), data.get("temperature_target"), data.get("speed_target"))
+            self.changed_keys = self._changed_since_last(data)
             return data
 
         except (ConnectionError, OSError, TimeoutError) as err:
-            self._properties_loaded = False
+            self.changed_keys = None
             self._cached_sensors = {}
             await self.client.disconnect()
             raise UpdateFailed(f"Connection error: {err}") from err
         except Exception as err:
+            self.changed_keys = None
             raise UpdateFailed(f"Error communicating with Breezart: {err}") from err
@@ -5,7 +5,7 @@ from homeassistant.components.number import NumberDeviceClass, NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -25,9 +25,10 @@ class BreezartTargetTemperature(CoordinatorEntity[BreezartDataCoordinator], Numb
     def __init__(self, coordinator: BreezartDataCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"breezart_{coordinator.client.host}_target_temp"
+        self._attr_unique_id = f"{coordinator.client.unique_id_prefix}target_temp"
         self._attr_native_min_value = float(coordinator.client.temp_min)
         self._attr_native_max_value = float(coordinator.client.temp_max)
+        self._attr_device_info = coordinator.client.device_info
 
     @property
     def native_value(self) -> float | None:
@@ -38,18 +39,12 @@ class BreezartTargetTemperature(CoordinatorEntity[BreezartDataCoordinator], Numb
 
     async def async_set_native_value(self, value: float) -> None:
         """Set target temperature via protocol."""
-        await self.coordinator.client.set_temperature(int(value))
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.client.host)},
-            name="Breezart",
-            manufacturer="Breezart",
-            model="550 Aqua",
-        )
+        try:
+            await self.coordinator.queue_write(
+                "temperature_target", self.coordinator.client.set_temperature, int(value)
+            )
+        except Exception as err:
+            raise HomeAssistantError(f"Failed to set temperature: {err}") from err
 
 
 class BreezartFanSpeed(CoordinatorEntity[BreezartDataCoordinator], NumberEntity):
@@ -62,9 +57,10 @@ class BreezartFanSpeed(CoordinatorEntity[BreezartDataCoordinator], NumberEntity)
     def __init__(self, coordinator: BreezartDataCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"breezart_{coordinator.client.host}_fan_speed"
+        self._attr_unique_id = f"{coordinator.client.unique_id_prefix}fan_speed"
         self._attr_native_min_value = float(coordinator.client.speed_min)
         self._attr_native_max_value = float(coordinator.client.speed_max)
+        self._attr_device_info = coordinator.client.device_info
 
     @property
     def native_value(self) -> float | None:
@@ -75,18 +71,12 @@ class BreezartFanSpeed(CoordinatorEntity[BreezartDataCoordinator], NumberEntity)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set fan speed via protocol."""
-        await self.coordinator.client.set_fan_speed(int(value))
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.client.host)},
-            name="Breezart",
-            manufacturer="Breezart",
-            model="550 Aqua",
-        )
+        try:
+            await self.coordinator.queue_write(
+                "speed_target", self.coordinator.client.set_fan_speed, int(value)
+            )
+        except Exception as err:
+            raise HomeAssistantError(f"Failed to set fan speed: {err}") from err
 
 
 async def async_setup_entry(
@@ -1,6 +1,11 @@
 """Sensor platform for Breezart integration."""
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -8,8 +13,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfPower, UnitOfTemperature
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -17,10 +21,32 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import COLOR_IND_MAP, COLOR_MSG_MAP, DOMAIN, MODE_MAP, MODE_SET_MAP, UNIT_STATE_MAP
 from .coordinator import BreezartDataCoordinator
 
+# Filter pollution (%) upper bounds and the status for each band
+_FILTER_THRESHOLDS = (30, 60, 85)
+_FILTER_STATUSES = ("Отличное", "Хорошее", "Требуется замена", "Забит")
+_FILTER_NO_DATA: dict[str, str] = {"status": "Нет данных"}
+
+
+@lru_cache(maxsize=64)
+def _unknown(raw_value: int) -> str:
+    """Return the label for a code missing from a value map."""
+    return f"Неизвестно ({raw_value})"
+
+
+class _MapWithUnknown(dict[int, str]):
+    """Value map that labels missing codes instead of raising KeyError."""
+
+    __slots__ = ()
+
+    def __missing__(self, raw_value: int) -> str:
+        return _unknown(raw_value)
+
 
 class BreezartSensor(CoordinatorEntity[BreezartDataCoordinator], SensorEntity):
     """Base class for Breezart sensors."""
 
+    __slots__ = ("_key",)
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -32,74 +58,87 @@ class BreezartSensor(CoordinatorEntity[BreezartDataCoordinator], SensorEntity):
         device_class: SensorDeviceClass | None = None,
         unit: str | None = None,
         entity_category: EntityCategory | None = None,
-        state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT,
         enabled_default: bool = True,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"breezart_{coordinator.client.host}_{unique_suffix}"
+        self._attr_unique_id = f"{coordinator.client.unique_id_prefix}{unique_suffix}"
         self._attr_name = name
         self._attr_device_class = device_class
         self._attr_native_unit_of_measurement = unit
         self._attr_entity_category = entity_category
-        self._attr_state_class = state_class
         self._attr_entity_registry_enabled_default = enabled_default
+        self._attr_device_info = coordinator.client.device_info
         self._key = key
+        self._update_native_value()
+
+    def _update_native_value(self) -> None:
+        """Latch the sensor value from the latest coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get(self._key) if data else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the value once per coordinator refresh, if it changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and self._key not in changed:
+            return
+        self._update_native_value()
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self) -> float | int | str | None:
-        """Return the sensor value from coordinator data."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(self._key)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.client.host)},
-            name="Breezart",
-            manufacturer="Breezart",
-            model="550 Aqua",
-            sw_version=str(self.coordinator.client.firmware_ver or ""),
-        )
+
+class BreezartNumericSensor(BreezartSensor):
+    """Sensor reporting a numeric measurement."""
+
+    __slots__ = ()
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+
+class BreezartDiagSensor(BreezartSensor):
+    """Sensor reporting a non-numeric value, such as a message or version."""
+
+    __slots__ = ()
 
 
 class BreezartTextSensor(BreezartSensor):
     """Sensor that maps numeric values to text using a dictionary."""
 
+    __slots__ = ("_lookup",)
+
     def __init__(
         self,
         coordinator: BreezartDataCoordinator,
         unique_suffix: str,
         name: str,
         key: str,
-        value_map: dict[int, str],
+        value_map: Mapping[int, str],
         entity_category: EntityCategory | None = None,
         enabled_default: bool = True,
     ) -> None:
         """Initialize the text sensor."""
+        # Bound before super().__init__(), which latches the first value
+        self._lookup = _MapWithUnknown(value_map).__getitem__
         super().__init__(
             coordinator, unique_suffix, name, key,
-            entity_category=entity_category, state_class=None,
-            enabled_default=enabled_default,
+            entity_category=entity_category, enabled_default=enabled_default,
         )
-        self._value_map = value_map
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the mapped text value."""
-        if not self.coordinator.data:
-            return None
-        raw_value = self.coordinator.data.get(self._key)
+    def _update_native_value(self) -> None:
+        """Latch the mapped text value."""
+        data = self.coordinator.data
+        raw_value = data.get(self._key) if data else None
         if raw_value is None:
-            return None
-        return self._value_map.get(raw_value, f"Неизвестно ({raw_value})")
+            self._attr_native_value = None
+        else:
+            self._attr_native_value = self._lookup(raw_value)
 
 
-class BreezartFilterSensor(BreezartSensor):
+class BreezartFilterSensor(BreezartNumericSensor):
     """Sensor for filter pollution status with text representation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: BreezartDataCoordinator,
@@ -114,34 +153,202 @@ class BreezartFilterSensor(BreezartSensor):
             enabled_default=False,
         )
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the numeric pollution value."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(self._key)
+    def _update_native_value(self) -> None:
+        """Latch the pollution value and its text status attribute."""
+        super()._update_native_value()
+        self._attr_extra_state_attributes = self._status_attributes()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str] | None:
+    def _status_attributes(self) -> dict[str, str] | None:
         """Return additional state attributes with text status."""
         if not self.coordinator.data:
             return None
-        
-        pollution = self.coordinator.data.get(self._key)
+
+        pollution = self._attr_native_value
         if pollution is None:
-            return {"status": "Нет данных"}
-        
-        # Map pollution percentage to status
-        if pollution < 30:
-            status = "Отличное"
-        elif pollution < 60:
-            status = "Хорошее"
-        elif pollution < 85:
-            status = "Требуется замена"
-        else:
-            status = "Забит"
-        
-        return {"status": status}
+            return _FILTER_NO_DATA
+
+        return {"status": _FILTER_STATUSES[bisect_right(_FILTER_THRESHOLDS, pollution)]}
+
+
+@dataclass(frozen=True, slots=True)
+class BreezartSensorDescription:
+    """Static description of a Breezart sensor entity."""
+
+    unique_suffix: str
+    name: str
+    key: str
+    device_class: SensorDeviceClass | None = None
+    unit: str | None = None
+    entity_category: EntityCategory | None = None
+    enabled_default: bool = True
+    numeric: bool = True  # Measurement state class when set
+    value_map: Mapping[int, str] | None = None  # Text sensor when set
+    filter_status: bool = False  # Filter sensor with a text status attribute
+
+
+BREEZART_SENSORS: tuple[BreezartSensorDescription, ...] = (
+    # --- Температуры ---
+    BreezartSensorDescription(
+        "temperature", "Температура (точка регулирования)",
+        "temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
+    ),
+    BreezartSensorDescription(
+        "temp_supply", "Температура подачи (выход установки)",
+        "temp_supply", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
+    ),
+    BreezartSensorDescription(
+        "temp_room", "Температура в помещении",
+        "temp_room", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
+        enabled_default=False,
+    ),
+    BreezartSensorDescription(
+        "temp_outdoor", "Температура на улице",
+        "temp_outdoor", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
+        enabled_default=False,
+    ),
+    BreezartSensorDescription(
+        "temp_water", "Температура теплоносителя",
+        "temp_water", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
+        enabled_default=False,
+    ),
+    BreezartSensorDescription(
+        "temperature_target", "Заданная температура",
+        "temperature_target", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # --- Скорость ---
+    BreezartSensorDescription(
+        "speed", "Скорость вентилятора",
+        "speed", unit=None,
+    ),
+    BreezartSensorDescription(
+        "speed_target", "Заданная скорость",
+        "speed_target", unit=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BreezartSensorDescription(
+        "speed_fact", "Фактическая скорость",
+        "speed_fact", unit=PERCENTAGE,
+        enabled_default=False,
+    ),
+    # --- Мощность ---
+    BreezartSensorDescription(
+        "power_consumption", "Потребляемая мощность",
+        "power_consumption", SensorDeviceClass.POWER, UnitOfPower.WATT,
+        enabled_default=False,
+    ),
+    # --- Фильтр ---
+    BreezartSensorDescription(
+        "filter_dust", "Загрязнённость фильтра",
+        "filter_dust", unit=PERCENTAGE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # --- Влажность ---
+    BreezartSensorDescription(
+        "humidity", "Влажность",
+        "humidity", SensorDeviceClass.HUMIDITY, PERCENTAGE,
+    ),
+    # --- Состояние ---
+    BreezartSensorDescription(
+        "unit_state", "Состояние установки",
+        "unit_state", value_map=UNIT_STATE_MAP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BreezartSensorDescription(
+        "mode", "Режим работы",
+        "mode", value_map=MODE_MAP,
+    ),
+    BreezartSensorDescription(
+        "mode_set", "Заданный режим",
+        "mode_set", value_map=MODE_SET_MAP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BreezartSensorDescription(
+        "color_ind", "Индикатор питания",
+        "color_ind", value_map=COLOR_IND_MAP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BreezartSensorDescription(
+        "color_msg", "Статус сообщения",
+        "color_msg", value_map=COLOR_MSG_MAP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # --- Сообщение устройства ---
+    BreezartSensorDescription(
+        "msg", "Сообщение устройства",
+        "msg", numeric=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # --- Прошивка/протокол ---
+    BreezartSensorDescription(
+        "firmware_ver", "Версия прошивки",
+        "firmware_ver", numeric=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BreezartSensorDescription(
+        "protocol_ver", "Версия протокола",
+        "protocol_ver", numeric=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # --- Дополнительная влажность ---
+    BreezartSensorDescription(
+        "humidity_supply", "Влажность на притоке",
+        "humidity_supply", SensorDeviceClass.HUMIDITY, PERCENTAGE,
+        enabled_default=False,
+    ),
+    BreezartSensorDescription(
+        "humidity_room", "Влажность в помещении",
+        "humidity_room", SensorDeviceClass.HUMIDITY, PERCENTAGE,
+        enabled_default=False,
+    ),
+    BreezartSensorDescription(
+        "humidity_outdoor", "Влажность уличного воздуха",
+        "humidity_outdoor", SensorDeviceClass.HUMIDITY, PERCENTAGE,
+        enabled_default=False,
+    ),
+    # --- Качество воздуха ---
+    BreezartSensorDescription(
+        "co2", "CO₂",
+        "co2", SensorDeviceClass.CO2, "ppm",
+        enabled_default=False,
+    ),
+    BreezartSensorDescription(
+        "voc", "VOC (загрязнённость воздуха)",
+        "voc", unit="ppb",
+        enabled_default=False,
+    ),
+    # --- Состояние фильтров ---
+    *(
+        BreezartSensorDescription(
+            f"filter{n}_pollution", f"Фильтр {n}", f"filter{n}_pollution",
+            filter_status=True,
+        )
+        for n in (1, 2, 3, 4)
+    ),
+)
+
+
+def _build(
+    coordinator: BreezartDataCoordinator, description: BreezartSensorDescription
+) -> BreezartSensor:
+    """Create the sensor entity for a description."""
+    if description.value_map is not None:
+        return BreezartTextSensor(
+            coordinator, description.unique_suffix, description.name, description.key,
+            description.value_map,
+            entity_category=description.entity_category,
+            enabled_default=description.enabled_default,
+        )
+    if description.filter_status:
+        return BreezartFilterSensor(
+            coordinator, description.unique_suffix, description.name, description.key,
+        )
+    sensor_class = BreezartNumericSensor if description.numeric else BreezartDiagSensor
+    return sensor_class(
+        coordinator, description.unique_suffix, description.name, description.key,
+        description.device_class, description.unit, description.entity_category,
+        description.enabled_default,
+    )
 
 
 async def async_setup_entry(
@@ -151,143 +358,4 @@ async def async_setup_entry(
 ) -> None:
     """Set up Breezart sensor entities."""
     coordinator: BreezartDataCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-
-    entities: list[SensorEntity] = [
-        # --- Температуры ---
-        BreezartSensor(
-            coordinator, "temperature", "Температура (точка регулирования)",
-            "temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
-        ),
-        BreezartSensor(
-            coordinator, "temp_supply", "Температура подачи (выход установки)",
-            "temp_supply", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
-        ),
-        BreezartSensor(
-            coordinator, "temp_room", "Температура в помещении",
-            "temp_room", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
-            enabled_default=False,
-        ),
-        BreezartSensor(
-            coordinator, "temp_outdoor", "Температура на улице",
-            "temp_outdoor", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
-            enabled_default=False,
-        ),
-        BreezartSensor(
-            coordinator, "temp_water", "Температура теплоносителя",
-            "temp_water", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
-            enabled_default=False,
-        ),
-        BreezartSensor(
-            coordinator, "temperature_target", "Заданная температура",
-            "temperature_target", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # --- Скорость ---
-        BreezartSensor(
-            coordinator, "speed", "Скорость вентилятора",
-            "speed", unit=None,
-        ),
-        BreezartSensor(
-            coordinator, "speed_target", "Заданная скорость",
-            "speed_target", unit=None,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartSensor(
-            coordinator, "speed_fact", "Фактическая скорость",
-            "speed_fact", unit=PERCENTAGE,
-            enabled_default=False,
-        ),
-        # --- Мощность ---
-        BreezartSensor(
-            coordinator, "power_consumption", "Потребляемая мощность",
-            "power_consumption", SensorDeviceClass.POWER, UnitOfPower.WATT,
-            enabled_default=False,
-        ),
-        # --- Фильтр ---
-        BreezartSensor(
-            coordinator, "filter_dust", "Загрязнённость фильтра",
-            "filter_dust", unit=PERCENTAGE,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # --- Влажность ---
-        BreezartSensor(
-            coordinator, "humidity", "Влажность",
-            "humidity", SensorDeviceClass.HUMIDITY, PERCENTAGE,
-        ),
-        # --- Состояние ---
-        BreezartTextSensor(
-            coordinator, "unit_state", "Состояние установки",
-            "unit_state", UNIT_STATE_MAP,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartTextSensor(
-            coordinator, "mode", "Режим работы",
-            "mode", MODE_MAP,
-        ),
-        BreezartTextSensor(
-            coordinator, "mode_set", "Заданный режим",
-            "mode_set", MODE_SET_MAP,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartTextSensor(
-            coordinator, "color_ind", "Индикатор питания",
-            "color_ind", COLOR_IND_MAP,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartTextSensor(
-            coordinator, "color_msg", "Статус сообщения",
-            "color_msg", COLOR_MSG_MAP,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # --- Сообщение устройства ---
-        BreezartSensor(
-            coordinator, "msg", "Сообщение устройства",
-            "msg", state_class=None,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # --- Прошивка/протокол ---
-        BreezartSensor(
-            coordinator, "firmware_ver", "Версия прошивки",
-            "firmware_ver", state_class=None,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        BreezartSensor(
-            coordinator, "protocol_ver", "Версия протокола",
-            "protocol_ver", state_class=None,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # --- Дополнительная влажность ---
-        BreezartSensor(
-            coordinator, "humidity_supply", "Влажность на притоке",
-            "humidity_supply", SensorDeviceClass.HUMIDITY, PERCENTAGE,
-            enabled_default=False,
-        ),
-        BreezartSensor(
-            coordinator, "humidity_room", "Влажность в помещении",
-            "humidity_room", SensorDeviceClass.HUMIDITY, PERCENTAGE,
-            enabled_default=False,
-        ),
-        BreezartSensor(
-            coordinator, "humidity_outdoor", "Влажность уличного воздуха",
-            "humidity_outdoor", SensorDeviceClass.HUMIDITY, PERCENTAGE,
-            enabled_default=False,
-        ),
-        # --- Качество воздуха ---
-        BreezartSensor(
-            coordinator, "co2", "CO₂",
-            "co2", SensorDeviceClass.CO2, "ppm",
-            enabled_default=False,
-        ),
-        BreezartSensor(
-            coordinator, "voc", "VOC (загрязнённость воздуха)",
-            "voc", unit="ppb",
-            enabled_default=False,
-        ),
-        # --- Состояние фильтров ---
-        BreezartFilterSensor(coordinator, "filter1_pollution", "Фильтр 1", "filter1_pollution"),
-        BreezartFilterSensor(coordinator, "filter2_pollution", "Фильтр 2", "filter2_pollution"),
-        BreezartFilterSensor(coordinator, "filter3_pollution", "Фильтр 3", "filter3_pollution"),
-        BreezartFilterSensor(coordinator, "filter4_pollution", "Фильтр 4", "filter4_pollution"),
-    ]
-
-    async_add_entities(entities)
+    async_add_entities([_build(coordinator, description) for description in BREEZART_SENSORS])
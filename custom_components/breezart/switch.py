@@ -3,8 +3,8 @@ from __future__ import annotations
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -15,40 +15,57 @@ from .coordinator import BreezartDataCoordinator
 class BreezartPowerSwitch(CoordinatorEntity[BreezartDataCoordinator], SwitchEntity):
     """Power switch for Breezart ventilation unit."""
 
+    __slots__ = ()
+
     _attr_has_entity_name = True
     _attr_name = "Питание"
 
     def __init__(self, coordinator: BreezartDataCoordinator) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"breezart_{coordinator.client.host}_power"
+        self._attr_unique_id = f"{coordinator.client.unique_id_prefix}power"
+        self._attr_device_info = coordinator.client.device_info
+        self._update_is_on()
+
+    def _update_is_on(self) -> None:
+        """Latch is_on (PwrBtnState == 1) from the latest coordinator data."""
+        data = self.coordinator.data
+        self._attr_is_on = bool(data.get("power")) if data else False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update is_on once per coordinator refresh, if it changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and "power" not in changed:
+            return
+        self._update_is_on()
+        super()._handle_coordinator_update()
+
+    async def _async_set_power(self, on: bool) -> None:
+        """Send the power command and publish the new state optimistically.
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if the unit is on (PwrBtnState == 1)."""
-        if not self.coordinator.data:
-            return False
-        return bool(self.coordinator.data.get("power", False))
+        The new state is published only after the device acknowledged
+        the write, so nothing needs reverting on failure; the next scheduled
+        poll confirms the value.
+        """
+        try:
+            await self.coordinator.client.set_power(on)
+        except Exception as err:
+            raise HomeAssistantError(f"Failed to set power: {err}") from err
+        data = self.coordinator.data
+        if data is None:
+            await self.coordinator.async_request_refresh()
+            return
+        # A new dict, so the coordinator can tell which key changed
+        self.coordinator.async_set_updated_data({**data, "power": on})
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the unit on."""
-        await self.coordinator.client.set_power(True)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_power(True)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the unit off."""
-        await self.coordinator.client.set_power(False)
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.client.host)},
-            name="Breezart",
-            manufacturer="Breezart",
-            model="550 Aqua",
-        )
+        await self._async_set_power(False)
 
 
 async def async_setup_entry(
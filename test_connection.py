@@ -8,53 +8,53 @@ async def test_breezart(host: str, port: int, password: int):
     """Test connection to Breezart."""
     print(f"Connecting to {host}:{port}...")
     
+    loop = asyncio.get_running_loop()
     try:
-        reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(host, port),
-            timeout=5.0
-        )
-        print("✓ TCP connection established")
+        # One 5 s budget for the whole test: connect, send, read and close
+        async with asyncio.timeout(5.0):
+            reader, writer = await asyncio.open_connection(host, port)
+            print("✓ TCP connection established")
         
-        # Build request
-        password_hex = f"{password:04x}"
-        request = f"VPr07_{password_hex}"
-        print(f"Sending: {request}")
+            # Build request
+            password_hex = f"{password:04x}"
+            request = f"VPr07_{password_hex}"
+            print(f"Sending: {request}")
         
-        # Send request (without newline, like breezart-client)
-        writer.write(request.encode())
-        await writer.drain()
-        print("✓ Request sent")
+            # Send request (without newline, like breezart-client)
+            writer.write(request.encode())
+            await writer.drain()
+            print("✓ Request sent")
         
-        # Try to read response
-        print("Waiting for response (3 seconds)...")
-        try:
-            # Try reading until newline
-            raw = await asyncio.wait_for(reader.readuntil(b'\n'), timeout=3.0)
-            response = raw.decode().strip()
-            print(f"✓ Response received: {response}")
-        except asyncio.TimeoutError:
-            print("✗ Timeout - no response received")
-            # Try reading any available data
-            try:
-                raw = await asyncio.wait_for(reader.read(1024), timeout=1.0)
-                if raw:
-                    print(f"  Partial data received: {raw}")
-                else:
-                    print("  No data available")
-            except:
-                print("  No data available at all")
-        except asyncio.LimitOverrunError:
-            print("✗ Response too long without newline, trying to read...")
-            raw = await asyncio.wait_for(reader.read(4096), timeout=1.0)
-            response = raw.decode().strip()
-            print(f"✓ Response received (no newline): {response}")
+            # Read under a single 3 s budget. The device usually answers without
+            # a trailing newline, so stop at a newline, EOF, or a short idle gap
+            # once data has started arriving.
+            print("Waiting for response (3 seconds)...")
+            buf = bytearray()
+            deadline = loop.time() + 3.0
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    async with asyncio.timeout(min(remaining, 0.2) if buf else remaining):
+                        chunk = await reader.read(256)
+                except TimeoutError:
+                    break
+                if not chunk:
+                    break
+                buf += chunk
+                if b"\n" in buf:
+                    break
         
-        writer.close()
-        await writer.wait_closed()
-        print("✓ Connection closed")
+            if buf:
+                response = buf.split(b"\n", 1)[0].decode(errors="replace").strip()
+                print(f"✓ Response received: {response}")
+            else:
+                print("✗ Timeout - no response received")
         
-    except asyncio.TimeoutError:
-        print("✗ Connection timeout")
+            writer.close()
+            await writer.wait_closed()
+            print("✓ Connection closed")
+        
+    except TimeoutError:
+        print("✗ Timeout - device did not answer within 5 seconds")
         return False
     except ConnectionRefusedError:
         print("✗ Connection refused - is the device on?")